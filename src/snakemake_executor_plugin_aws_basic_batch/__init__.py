@@ -11,15 +11,22 @@ __copyright__ = "Copyright 2025"
 __email__ = "radusuciu@gmail.com"
 __license__ = "MIT"
 
+import json
+import logging
 import os
 import shlex
 import shutil
 import sys
-import uuid
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass, field
+from functools import cached_property
 from pprint import pformat
 from typing import AsyncGenerator, List, Optional
 
+from botocore.exceptions import ClientError
 from snakemake_interface_common.exceptions import WorkflowError
 from snakemake_interface_executor_plugins.executors.base import SubmittedJobInfo
 from snakemake_interface_executor_plugins.executors.remote import RemoteExecutor
@@ -29,7 +36,11 @@ from snakemake_interface_executor_plugins.settings import (
     ExecutorSettingsBase,
 )
 
-from snakemake_executor_plugin_aws_basic_batch.batch_client import BatchClient
+from snakemake_executor_plugin_aws_basic_batch.batch_client import (
+    DESCRIBE_JOBS_MAX_IDS,
+    BatchClient,
+)
+from snakemake_executor_plugin_aws_basic_batch.event_queue import JobEventQueue
 
 
 @dataclass
@@ -62,6 +73,43 @@ class ExecutorSettings(ExecutorSettingsBase):
             "required": True,
         },
     )
+    events_sqs_url: Optional[str] = field(
+        default=None,
+        metadata={
+            "help": (
+                "URL of an SQS queue receiving AWS Batch job state change events "
+                "for the job queue (e.g. via an EventBridge rule). When set, job "
+                "completions are taken from the queue and jobs are only polled "
+                "through the Batch API periodically as a fallback."
+            ),
+            "env_var": True,
+            "required": False,
+        },
+    )
+    max_concurrent_jobs: Optional[int] = field(
+        default=None,
+        metadata={
+            "help": (
+                "Maximum number of jobs submitted to AWS Batch and not yet "
+                "finished at any time. Further jobs are held back and submitted "
+                "as running jobs finish, e.g. to stay under account job limits."
+            ),
+            "env_var": False,
+            "required": False,
+        },
+    )
+    array_job_min_size: Optional[int] = field(
+        default=None,
+        metadata={
+            "help": (
+                "Submit jobs that become ready together as AWS Batch array jobs "
+                "when there are at least this many of them, turning many "
+                "SubmitJob requests into one. Disabled by default."
+            ),
+            "env_var": False,
+            "required": False,
+        },
+    )
     # Coordinator mode settings
     # TODO: do we even need this? if we're using this executor plugin, then maybe we always want coordinator mode?
     coordinator: Optional[bool] = field(
@@ -116,29 +164,147 @@ common_settings = CommonSettings(
 # Environment variable to detect if we're running inside a coordinator job
 COORDINATOR_CONTEXT_ENV_VAR = "SNAKEMAKE_AWS_BASIC_BATCH_COORDINATOR_CONTEXT"
 
+# Terminal Batch job statuses, mapped to (default exit code, whether it failed)
+_TERMINAL_STATUSES = {"SUCCEEDED": (0, False), "FAILED": (1, True)}
+
+# Status polling backs off from the base delay (overridable via this environment
+# variable) up to the cap while no jobs finish, and resets once one does.
+POLL_DELAY_ENV_VAR = "SNAKEMAKE_AWS_BASIC_BATCH_POLL_DELAY_SECONDS"
+DEFAULT_POLL_DELAY_SECONDS = 5
+MAX_POLL_DELAY_SECONDS = 60
+POLL_BACKOFF_FACTOR = 1.5
+
+# With an event queue, jobs are only polled via the Batch API once this many
+# seconds have passed since the last poll, to catch jobs whose events were
+# missed. Measured in time rather than status checks, which back off.
+EVENTS_FALLBACK_SECONDS = 60
+# Maximum number of ReceiveMessage requests used to drain the event queue per
+# status check.
+EVENTS_MAX_BATCHES_PER_TICK = 10
+
+# AWS Batch array jobs have between 2 and 10,000 child jobs
+ARRAY_JOB_MAX_SIZE = 10_000
+# Every child command is embedded in the array job's container overrides, which
+# Batch rejects once serialized beyond 8192 characters, so large groups are
+# split across several array jobs.
+ARRAY_JOB_MAX_OVERRIDES_BYTES = 8192
+
+# Margin applied to local submission times when listing jobs by creation time,
+# to allow for clock skew between this host and AWS.
+LIST_JOBS_CLOCK_SLACK_SECONDS = 300
+
+# Number of threads used to issue SubmitJob requests concurrently
+SUBMIT_MAX_WORKERS = 16
+# Number of threads used to issue TerminateJob requests when cancelling
+TERMINATE_MAX_WORKERS = 32
+
+
+def _json_bytes(value) -> int:
+    """Return the size of a value serialized as JSON, in encoded bytes."""
+    return len(json.dumps(value, ensure_ascii=False).encode())
+
 
 class Executor(RemoteExecutor):
+    CONSOLE_JOB_URL = (
+        "https://console.aws.amazon.com/batch/home?region={region}#jobs/detail/{job_id}"
+    )
+
     def __post_init__(self):
         self.container_image = self.workflow.remote_execution_settings.container_image
-        self.next_seconds_between_status_checks = 5
+
+        try:
+            self._base_poll_interval = float(
+                os.environ.get(POLL_DELAY_ENV_VAR, DEFAULT_POLL_DELAY_SECONDS)
+            )
+        except ValueError as e:
+            raise WorkflowError(f"Invalid value for {POLL_DELAY_ENV_VAR}: {e}") from e
+        if not self._base_poll_interval > 0:
+            raise WorkflowError(
+                f"Invalid value for {POLL_DELAY_ENV_VAR}: must be a positive number "
+                f"of seconds, got {self._base_poll_interval}"
+            )
+        self._poll_interval = self._base_poll_interval
+        self.next_seconds_between_status_checks = self._poll_interval
+        self._last_logged_active = -1
 
         self.settings = self.workflow.executor_settings
-        self.logger.debug(f"ExecutorSettings: {pformat(self.settings, indent=2)}")
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("ExecutorSettings: %s", pformat(self.settings, indent=2))
+
+        max_concurrent_jobs = self.settings.max_concurrent_jobs
+        if max_concurrent_jobs is not None and not (
+            isinstance(max_concurrent_jobs, int) and max_concurrent_jobs >= 1
+        ):
+            raise WorkflowError(
+                "Invalid value for max_concurrent_jobs: must be a positive integer, "
+                f"got {max_concurrent_jobs}"
+            )
 
-        try:
-            self.batch_client = BatchClient(region_name=self.settings.region)
-        except Exception as e:
-            raise WorkflowError(f"Failed to initialize AWS Batch client: {e}") from e
+        # SubmitJob arguments shared by every job submission
+        self._submit_template = {
+            "jobQueue": self.settings.job_queue,
+            "jobDefinition": self.settings.job_definition,
+        }
+        # Environment passed to every job; envvars() is fixed for the workflow
+        self._env_overrides = [
+            {"name": k, "value": v} for k, v in self.envvars().items()
+        ]
+        # Jobs handed to the executor but not yet submitted, the number of
+        # submitted jobs that have not finished, and whether the workflow was
+        # cancelled; guarded by the submission lock.
+        self._pending_submissions = deque()
+        self._num_active = 0
+        self._cancelled = False
+        self._submission_lock = threading.Lock()
+
+        # Whether we're running inside a coordinator job; fixed for the process
+        self._in_coordinator_context = (
+            os.environ.get(COORDINATOR_CONTEXT_ENV_VAR) == "1"
+        )
 
         # Check if coordinator mode is enabled and we're not inside a coordinator job
-        if self.settings.coordinator and not self._is_coordinator_context():
+        if self.settings.coordinator and not self._in_coordinator_context:
             self._coordinator_pending = True
+            self._coordinator_command = self._build_coordinator_command()
+            self._coordinator_env = self._get_coordinator_environment()
         else:
             self._coordinator_pending = False
+            self._coordinator_command = None
+            self._coordinator_env = None
 
-    def _is_coordinator_context(self) -> bool:
-        """Check if we're running inside a coordinator job."""
-        return os.environ.get(COORDINATOR_CONTEXT_ENV_VAR) == "1"
+        # A process that only submits the coordinator job never checks statuses
+        self.event_queue = None
+        self._last_status_poll = time.monotonic()
+        if self.settings.events_sqs_url and not self._coordinator_pending:
+            try:
+                self.event_queue = JobEventQueue(
+                    self.settings.events_sqs_url,
+                    region_name=self.settings.region,
+                    logger=self.logger,
+                )
+            except Exception as e:
+                raise WorkflowError(
+                    f"Failed to initialize job event queue client: {e}"
+                ) from e
+
+    @cached_property
+    def _submit_pool(self) -> ThreadPoolExecutor:
+        """Thread pool issuing SubmitJob requests, created on first submission."""
+        return ThreadPoolExecutor(
+            max_workers=SUBMIT_MAX_WORKERS, thread_name_prefix="batch-submit"
+        )
+
+    @cached_property
+    def batch_client(self) -> BatchClient:
+        """AWS Batch client, created on first use.
+
+        A coordinator submission only needs it for a single request, and
+        clients are shared per region across executor instances.
+        """
+        try:
+            return BatchClient(region_name=self.settings.region)
+        except Exception as e:
+            raise WorkflowError(f"Failed to initialize AWS Batch client: {e}") from e
 
     def _build_coordinator_command(self) -> str:
         """Build the coordinator command.
@@ -172,15 +338,15 @@ class Executor(RemoteExecutor):
         After successful submission, exits with code 0. The coordinator job
         will handle the actual workflow execution in AWS Batch.
         """
-        job_uuid = str(uuid.uuid4())
-        job_name = f"snakemake-coordinator-{job_uuid}"
+        job_suffix = os.urandom(4).hex()
+        job_name = f"snakemake-coordinator-{job_suffix}"
 
         coordinator_queue = self.settings.coordinator_queue or self.settings.job_queue
         coordinator_job_def = (
             self.settings.coordinator_job_definition or self.settings.job_definition
         )
 
-        command = self._build_coordinator_command()
+        command = self._coordinator_command
         self.logger.debug(f"Coordinator command: {command}")
 
         try:
@@ -190,16 +356,15 @@ class Executor(RemoteExecutor):
                 jobDefinition=coordinator_job_def,
                 containerOverrides={
                     "command": ["/bin/bash", "-c", command],
-                    "environment": self._get_coordinator_environment(),
+                    "environment": self._coordinator_env,
                 },
             )
         except Exception as e:
             raise WorkflowError(f"Failed to submit coordinator job: {e}") from e
 
         job_id = job_info["jobId"]
-        console_url = (
-            f"https://console.aws.amazon.com/batch/home?"
-            f"region={self.settings.region}#jobs/detail/{job_id}"
+        console_url = self.CONSOLE_JOB_URL.format(
+            region=self.settings.region, job_id=job_id
         )
 
         self.logger.info(
@@ -209,9 +374,17 @@ class Executor(RemoteExecutor):
         )
 
         # Clean up workflow lock before exiting - os._exit() bypasses normal cleanup
+        # The lock directory only holds a few flat files, so skip rmtree's walk.
         lock_dir = self.workflow.persistence.path / "locks"
-        if lock_dir.exists():
-            shutil.rmtree(lock_dir)
+        try:
+            with os.scandir(lock_dir) as entries:
+                for entry in entries:
+                    os.unlink(entry.path)
+            os.rmdir(lock_dir)
+        except FileNotFoundError:
+            pass
+        except OSError:
+            shutil.rmtree(lock_dir, ignore_errors=True)
 
         # Use os._exit(0) to terminate immediately without raising SystemExit.
         # sys.exit(0) raises SystemExit which Snakemake's scheduler catches
@@ -219,46 +392,258 @@ class Executor(RemoteExecutor):
         os._exit(0)
 
     def run_jobs(self, jobs: List[JobExecutorInterface]):
-        """Override to submit coordinator job when sources are ready."""
+        """Submit jobs to AWS Batch concurrently.
+
+        Submits the coordinator job first when sources are ready. Job commands
+        are formatted on the calling thread; only the SubmitJob requests run on
+        the submission thread pool. With max_concurrent_jobs set, jobs beyond
+        the limit are queued and submitted as running jobs finish.
+        """
         if self._coordinator_pending:
             self._coordinator_pending = False
             self._submit_coordinator_job()
 
-        return super().run_jobs(jobs)
+        # Pick up newly submitted jobs at the base polling rate
+        self._reset_poll_interval()
+
+        submissions = []
+        for job in jobs:
+            self.run_job_pre(job)
+            submissions.append((job, self.format_job_exec(job)))
+
+        with self._submission_lock:
+            self._pending_submissions.extend(submissions)
+            self._submit_pending()
 
     def run_job(self, job: JobExecutorInterface):
         """Submit a job to AWS Batch using the pre-configured job definition."""
-        job_uuid = str(uuid.uuid4())
-        job_name = f"snakejob-{job.name}-{job_uuid}"
+        with self._submission_lock:
+            self._pending_submissions.append((job, self.format_job_exec(job)))
+            self._submit_pending()
+
+    def _submit_pending(self, raise_errors: bool = True):
+        """Submit queued jobs, up to max_concurrent_jobs running at once.
+
+        Must be called with the submission lock held. Submissions are reported
+        in order. Jobs that fail to submit raise a WorkflowError, or with
+        ``raise_errors=False`` are reported as failed jobs instead. Nothing is
+        submitted once the workflow has been cancelled.
+        """
+        if self._cancelled:
+            return
+
+        limit = self.settings.max_concurrent_jobs
+        count = len(self._pending_submissions)
+        if limit:
+            count = max(0, min(count, limit - self._num_active))
+            if count < len(self._pending_submissions):
+                self.logger.debug(
+                    "Deferring %d job submissions (max_concurrent_jobs=%d)",
+                    len(self._pending_submissions) - count,
+                    limit,
+                )
+        submissions = [self._pending_submissions.popleft() for _ in range(count)]
 
-        # Get the command to execute
-        job_command = self.format_job_exec(job)
+        futures = [
+            self._submit_pool.submit(self._submit_group, group)
+            for group in self._group_submissions(submissions)
+        ]
 
-        # Build environment from envvars
-        environment = [{"name": k, "value": v} for k, v in self.envvars().items()]
+        # Report every successful submission before raising, so that no
+        # submitted Batch job goes untracked.
+        failures = []
+        for future in futures:
+            submitted, failed = future.result()
+            for job, job_info, job_name in submitted:
+                self._report_submission(job, job_info, job_name)
+                self._num_active += 1
+            failures.extend(failed)
+
+        if failures and raise_errors:
+            raise failures[0][1]
+        for job, error in failures:
+            self.logger.error(f"Job {job.name}: {error}")
+            self.report_job_error(SubmittedJobInfo(job=job), msg=str(error))
+
+    def _submit_one(
+        self, job: JobExecutorInterface, job_command: str
+    ) -> tuple[JobExecutorInterface, dict, str]:
+        """Submit a single job to AWS Batch without reporting it."""
+        job_suffix = os.urandom(4).hex()
+        job_name = f"snakejob-{job.name}-{job_suffix}"
 
         try:
             job_info = self.batch_client.submit_job(
+                **self._submit_template,
                 jobName=job_name,
-                jobQueue=self.settings.job_queue,
-                jobDefinition=self.settings.job_definition,
-                containerOverrides={
-                    "command": ["/bin/bash", "-c", job_command],
-                    "environment": environment,
-                },
+                containerOverrides=self._container_overrides(job_command),
             )
 
             self.logger.debug(
-                f"AWS Batch job submitted: name={job_name}, id={job_info['jobId']}"
+                "AWS Batch job submitted: name=%s, id=%s", job_name, job_info["jobId"]
             )
         except Exception as e:
             raise WorkflowError(f"Failed to submit AWS Batch job: {e}") from e
 
+        return job, job_info, job_name
+
+    def _container_overrides(self, command: str) -> dict:
+        """Build container overrides running a shell command.
+
+        The environment is omitted entirely when there are no variables to pass.
+        """
+        overrides = {"command": ["/bin/bash", "-c", command]}
+        if self._env_overrides:
+            overrides["environment"] = self._env_overrides
+        return overrides
+
+    def _group_submissions(
+        self, submissions: list[tuple[JobExecutorInterface, str]]
+    ) -> list[list[tuple[JobExecutorInterface, str]]]:
+        """Split (job, command) pairs into groups submitted by one request each.
+
+        All jobs share the configured job queue and definition, so with array
+        jobs enabled any jobs can be grouped; groups are only bounded by the
+        array size and the size of their serialized container overrides.
+        """
+        min_size = max(self.settings.array_job_min_size or 0, 2)
+        if not self.settings.array_job_min_size or len(submissions) < min_size:
+            return [[submission] for submission in submissions]
+
+        # Overrides of an empty array command: the environment and the case
+        # statement framing, which every group pays once.
+        base_bytes = _json_bytes(
+            self._container_overrides(self._build_array_command([]))
+        )
+
+        groups = []
+        group = []
+        group_bytes = base_bytes
+        for job, job_command in submissions:
+            # Each branch appears inside the JSON-encoded command string, so
+            # measure it with its JSON escaping but without the enclosing quotes.
+            branch_bytes = _json_bytes(self._array_branch(len(group), job_command)) - 2
+            if group and (
+                len(group) >= ARRAY_JOB_MAX_SIZE
+                or group_bytes + branch_bytes > ARRAY_JOB_MAX_OVERRIDES_BYTES
+            ):
+                groups.append(group)
+                group = []
+                group_bytes = base_bytes
+                branch_bytes = _json_bytes(self._array_branch(0, job_command)) - 2
+            group.append((job, job_command))
+            group_bytes += branch_bytes
+        groups.append(group)
+
+        # Groups too small to be worth an array job are submitted individually
+        result = []
+        for group in groups:
+            if len(group) < min_size:
+                result.extend([submission] for submission in group)
+            else:
+                result.append(group)
+        return result
+
+    def _submit_group(
+        self, group: list[tuple[JobExecutorInterface, str]]
+    ) -> tuple[
+        list[tuple[JobExecutorInterface, dict, str]],
+        list[tuple[JobExecutorInterface, WorkflowError]],
+    ]:
+        """Submit a group of jobs, as an array job if it has several.
+
+        Returns the submitted jobs and the jobs that failed to submit, with
+        their errors. If Batch rejects the array job request itself, e.g.
+        because the overrides are still too large, the jobs are submitted one
+        by one.
+        """
+        if len(group) > 1:
+            try:
+                return self._submit_array(group), []
+            except WorkflowError as e:
+                cause = e.__cause__
+                if not (
+                    isinstance(cause, ClientError)
+                    and cause.response.get("Error", {}).get("Code") == "ClientException"
+                ):
+                    return [], [(job, e) for job, _ in group]
+                self.logger.warning(
+                    f"{e}; submitting its {len(group)} jobs individually instead"
+                )
+
+        submitted = []
+        failed = []
+        for job, job_command in group:
+            try:
+                submitted.append(self._submit_one(job, job_command))
+            except WorkflowError as e:
+                failed.append((job, e))
+        return submitted, failed
+
+    def _submit_array(
+        self, group: list[tuple[JobExecutorInterface, str]]
+    ) -> list[tuple[JobExecutorInterface, dict, str]]:
+        """Submit jobs as the children of a single array job without reporting.
+
+        Each child selects its own command by AWS_BATCH_JOB_ARRAY_INDEX. Child
+        jobs have the ID ``<array job ID>:<index>``, which DescribeJobs,
+        TerminateJob and job state change events all use directly.
+        """
+        job_suffix = os.urandom(4).hex()
+        job_name = f"snakejob-array-{job_suffix}"
+
+        try:
+            job_info = self.batch_client.submit_job(
+                **self._submit_template,
+                jobName=job_name,
+                arrayProperties={"size": len(group)},
+                containerOverrides=self._container_overrides(
+                    self._build_array_command([cmd for _, cmd in group])
+                ),
+            )
+
+            self.logger.debug(
+                "AWS Batch array job submitted: name=%s, id=%s, size=%d",
+                job_name,
+                job_info["jobId"],
+                len(group),
+            )
+        except Exception as e:
+            raise WorkflowError(f"Failed to submit AWS Batch array job: {e}") from e
+
+        return [
+            (job, {"jobId": f"{job_info['jobId']}:{index}"}, f"{job_name}:{index}")
+            for index, (job, _) in enumerate(group)
+        ]
+
+    @staticmethod
+    def _build_array_command(job_commands: list[str]) -> str:
+        """Build a script that runs the command for the current array index."""
+        branches = "".join(
+            Executor._array_branch(index, job_command)
+            for index, job_command in enumerate(job_commands)
+        )
+        return (
+            'case "$AWS_BATCH_JOB_ARRAY_INDEX" in\n'
+            f"{branches}"
+            '*) echo "Unknown array index: $AWS_BATCH_JOB_ARRAY_INDEX" >&2; exit 1 ;;\n'
+            "esac"
+        )
+
+    @staticmethod
+    def _array_branch(index: int, job_command: str) -> str:
+        """Build the case branch running a job command for one array index."""
+        return f"{index}) exec /bin/bash -c {shlex.quote(job_command)} ;;\n"
+
+    def _report_submission(
+        self, job: JobExecutorInterface, job_info: dict, job_name: str
+    ):
+        """Register a submitted Batch job with Snakemake."""
         self.report_job_submission(
             SubmittedJobInfo(
                 job=job,
                 external_jobid=job_info["jobId"],
-                aux={"job_name": job_name},
+                aux={"job_name": job_name, "submitted_at": time.time()},
             )
         )
 
@@ -266,13 +651,52 @@ class Executor(RemoteExecutor):
         self, active_jobs: List[SubmittedJobInfo]
     ) -> AsyncGenerator[SubmittedJobInfo, None]:
         """Check the status of active jobs."""
-        self.logger.debug(f"Monitoring {len(active_jobs)} active Batch jobs")
-
-        for job in active_jobs:
+        if not active_jobs:
+            return
+
+        # Only log the active job count when it changes, not on every tick
+        if (
+            self.logger.isEnabledFor(logging.DEBUG)
+            and len(active_jobs) != self._last_logged_active
+        ):
+            self._last_logged_active = len(active_jobs)
+            self.logger.debug("Monitoring %d active Batch jobs", len(active_jobs))
+
+        id_to_job = {job.external_jobid: job for job in active_jobs}
+        job_infos = []
+
+        if self.event_queue is not None:
+            job_infos.extend(self._receive_job_events())
+
+        now = time.monotonic()
+        if (
+            self.event_queue is None
+            or now - self._last_status_poll >= EVENTS_FALLBACK_SECONDS
+        ):
+            self._last_status_poll = now
+            resolved = {job_info.get("jobId") for job_info in job_infos}
+            unresolved = [
+                job for job_id, job in id_to_job.items() if job_id not in resolved
+            ]
+
+            # A single rate-limited slot covers the whole sweep, since it takes
+            # a handful of paginated list/describe requests for any job count.
             async with self.status_rate_limiter:
-                status_code, msg = self._get_job_status(job)
+                try:
+                    job_infos.extend(self._poll_job_statuses(unresolved))
+                except Exception as e:
+                    self.logger.error(f"Error getting job status: {e}")
+
+        finished = 0
+        for job_info in job_infos:
+            job = id_to_job.pop(job_info.get("jobId"), None)
+            if job is None:
+                continue
+
+            status_code, msg = self._get_job_status(job_info)
 
             if status_code is not None:
+                finished += 1
                 if status_code == 0:
                     self.report_job_success(job)
                 else:
@@ -281,42 +705,128 @@ class Executor(RemoteExecutor):
             else:
                 yield job
 
-    def _get_job_status(self, job: SubmittedJobInfo) -> tuple[int, Optional[str]]:
-        """Poll for Batch job status and return exit code if complete."""
+        # Jobs without a status this tick (not polled, missing from the
+        # response, or the request failed) are kept active and checked again
+        # on the next tick.
+        for job in id_to_job.values():
+            yield job
+
+        if finished:
+            with self._submission_lock:
+                self._num_active -= finished
+                self._submit_pending(raise_errors=False)
+            self._reset_poll_interval()
+        else:
+            self._poll_interval = min(
+                self._poll_interval * POLL_BACKOFF_FACTOR,
+                max(MAX_POLL_DELAY_SECONDS, self._base_poll_interval),
+            )
+            self.next_seconds_between_status_checks = self._poll_interval
+
+    def _poll_job_statuses(self, jobs: List[SubmittedJobInfo]) -> list:
+        """Fetch the current status of the given jobs.
+
+        Up to one DescribeJobs request's worth of top-level jobs are simply
+        described. Beyond that they are found with ListJobs, restricted to jobs
+        created since the oldest of them was submitted; its job summaries
+        already carry the status, reason and exit code, so no per-job
+        DescribeJobs is needed. Array children are not listed for the queue, so
+        they are always described, as are any jobs the listing missed.
+        """
+        describe_ids = [job.external_jobid for job in jobs if ":" in job.external_jobid]
+        top_level = {
+            job.external_jobid: job for job in jobs if ":" not in job.external_jobid
+        }
+
+        job_infos = []
+        if len(top_level) > DESCRIBE_JOBS_MAX_IDS:
+            created_after = min(job.aux["submitted_at"] for job in top_level.values())
+            created_after_ms = int(
+                (created_after - LIST_JOBS_CLOCK_SLACK_SECONDS) * 1000
+            )
+            summaries = self.batch_client.list_job_summaries(
+                jobQueue=self.settings.job_queue,
+                filters=[
+                    {"name": "AFTER_CREATED_AT", "values": [str(created_after_ms)]}
+                ],
+            )
+            for summary in summaries:
+                if top_level.pop(summary.get("jobId"), None) is not None:
+                    job_infos.append(summary)
+        describe_ids.extend(top_level)
+        if describe_ids:
+            job_infos.extend(self.batch_client.describe_jobs_bulk(describe_ids))
+        return job_infos
+
+    def _receive_job_events(self) -> list:
+        """Drain terminal job state change events from the event queue."""
         try:
-            response = self.batch_client.describe_jobs(jobs=[job.external_jobid])
-            jobs = response.get("jobs", [])
+            details = self.event_queue.receive_job_events(
+                max_batches=EVENTS_MAX_BATCHES_PER_TICK
+            )
+        except Exception as e:
+            self.logger.error(f"Error receiving job events: {e}")
+            return []
 
-            if not jobs:
-                return None, f"No job found with ID {job.external_jobid}"
+        # Only terminal events resolve a job; active jobs are kept by default.
+        return [
+            detail for detail in details if detail.get("status") in _TERMINAL_STATUSES
+        ]
 
-            job_info = jobs[0]
-            job_status = job_info.get("status", "UNKNOWN")
-            exit_code = job_info.get("container", {}).get("exitCode", None)
+    def _reset_poll_interval(self):
+        """Return status polling to the base delay."""
+        self._poll_interval = self._base_poll_interval
+        self.next_seconds_between_status_checks = self._poll_interval
 
-            if job_status == "SUCCEEDED":
-                return 0, None
-            elif job_status == "FAILED":
-                reason = job_info.get("statusReason", "Unknown reason")
-                return exit_code or 1, reason
-            else:
-                self.logger.debug(f"Job {job.external_jobid} status: {job_status}")
-                return None, None
-        except Exception as e:
-            self.logger.error(f"Error getting job status: {e}")
-            return None, str(e)
+    def _get_job_status(self, job_info: dict) -> tuple[int, Optional[str]]:
+        """Return exit code and reason from a job description if complete."""
+        job_status = job_info.get("status", "UNKNOWN")
+        terminal = _TERMINAL_STATUSES.get(job_status)
+
+        if terminal is None:
+            self.logger.debug("Job %s status: %s", job_info.get("jobId"), job_status)
+            return None, None
+
+        default_code, failed = terminal
+        if not failed:
+            return default_code, None
+
+        exit_code = job_info.get("container", {}).get("exitCode", None)
+        reason = job_info.get("statusReason", "Unknown reason")
+        return exit_code or default_code, reason
+
+    def shutdown(self):
+        super().shutdown()
+        # Only shut the submission pool down if a submission ever created it
+        if "_submit_pool" in self.__dict__:
+            self._submit_pool.shutdown()
 
     def cancel_jobs(self, active_jobs: List[SubmittedJobInfo]):
-        """Cancel all active jobs."""
+        """Cancel all active jobs.
+
+        Queued submissions are dropped first, so that no job is submitted
+        while or after the active ones are terminated.
+        """
         self.logger.info("Shutting down, cancelling active jobs...")
-        for job in active_jobs:
-            try:
-                self.logger.debug(f"Terminating job {job.external_jobid}")
-                self.batch_client.terminate_job(
-                    jobId=job.external_jobid,
-                    reason="Terminated by Snakemake",
-                )
-            except Exception as e:
-                self.logger.warning(
-                    f"Failed to terminate job {job.external_jobid}: {e}"
-                )
+        with self._submission_lock:
+            self._cancelled = True
+            self._pending_submissions.clear()
+        with ThreadPoolExecutor(max_workers=TERMINATE_MAX_WORKERS) as pool:
+            futures = {
+                pool.submit(self._terminate_job, job): job for job in active_jobs
+            }
+            for future in as_completed(futures):
+                try:
+                    future.result()
+                except Exception as e:
+                    self.logger.warning(
+                        f"Failed to terminate job {futures[future].external_jobid}: {e}"
+                    )
+
+    def _terminate_job(self, job: SubmittedJobInfo):
+        """Terminate a single Batch job."""
+        self.logger.debug(f"Terminating job {job.external_jobid}")
+        self.batch_client.terminate_job(
+            jobId=job.external_jobid,
+            reason="Terminated by Snakemake",
+        )
@@ -1,20 +1,122 @@
+import threading
+import time
+from typing import Any
+
 import boto3
+from botocore.config import Config
+
+# Maximum number of job IDs accepted by a single DescribeJobs request
+DESCRIBE_JOBS_MAX_IDS = 100
+# Maximum number of job summaries returned by a single ListJobs request
+LIST_JOBS_PAGE_SIZE = 1000
+
+# Connection pooling and retry settings for the plugin's AWS clients. boto3
+# clients are thread-safe, so a single pooled Batch client is shared per region
+# by every BatchClient in the process.
+CLIENT_CONFIG = Config(
+    max_pool_connections=50,
+    tcp_keepalive=True,
+    retries={"mode": "adaptive", "max_attempts": 10},
+)
+_CLIENTS: dict[str, Any] = {}
+_CLIENTS_LOCK = threading.Lock()
+
+# AWS Batch allows 50 SubmitJob requests per second per region; stay just below
+# that so bursts of submissions don't end up in throttling retries.
+SUBMIT_JOB_RATE = 45
+SUBMIT_JOB_BURST = 50
+
+
+class _TokenBucket:
+    """Thread-safe token bucket rate limiter."""
+
+    def __init__(self, rate, capacity):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Take a token, blocking until one is available.
+
+        When the bucket is empty the token is borrowed against future refills
+        and the caller sleeps off the deficit, so concurrent callers are spaced
+        out at the configured rate in arrival order.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.capacity, self._tokens + (now - self._updated) * self.rate
+            )
+            self._updated = now
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0
+        if wait > 0:
+            time.sleep(wait)
+
+
+_SUBMIT_BUCKETS: dict[str, _TokenBucket] = {}
+
+
+def _get_client(region_name=None):
+    """Return the shared boto3 Batch client for a region, creating it if needed."""
+    with _CLIENTS_LOCK:
+        client = _CLIENTS.get(region_name)
+        if client is None:
+            client = boto3.session.Session().client(
+                "batch", region_name=region_name, config=CLIENT_CONFIG
+            )
+            _CLIENTS[region_name] = client
+        return client
+
+
+def _get_submit_bucket(region_name=None):
+    """Return the SubmitJob rate limiter shared by all clients for a region."""
+    with _CLIENTS_LOCK:
+        bucket = _SUBMIT_BUCKETS.get(region_name)
+        if bucket is None:
+            bucket = _TokenBucket(rate=SUBMIT_JOB_RATE, capacity=SUBMIT_JOB_BURST)
+            _SUBMIT_BUCKETS[region_name] = bucket
+        return bucket
 
 
 class BatchClient:
     """Minimal wrapper around boto3 Batch client."""
 
     def __init__(self, region_name=None):
-        self.client = boto3.client("batch", region_name=region_name)
+        self.client = _get_client(region_name)
+        self._submit_bucket = _get_submit_bucket(region_name)
 
     def submit_job(self, **kwargs):
-        """Submit a job to AWS Batch."""
+        """Submit a job to AWS Batch, rate limited below the SubmitJob quota."""
+        self._submit_bucket.acquire()
         return self.client.submit_job(**kwargs)
 
     def describe_jobs(self, **kwargs):
         """Describe jobs in AWS Batch."""
         return self.client.describe_jobs(**kwargs)
 
+    def describe_jobs_bulk(self, job_ids):
+        """Describe any number of jobs, chunking into DescribeJobs-sized requests."""
+        job_ids = list(job_ids)
+        jobs = []
+        for i in range(0, len(job_ids), DESCRIBE_JOBS_MAX_IDS):
+            chunk = job_ids[i : i + DESCRIBE_JOBS_MAX_IDS]
+            response = self.client.describe_jobs(jobs=chunk)
+            jobs.extend(response.get("jobs", []))
+        return jobs
+
+    def list_job_summaries(self, **kwargs):
+        """List job summaries in AWS Batch, following pagination."""
+        paginator = self.client.get_paginator("list_jobs")
+        summaries = []
+        for page in paginator.paginate(
+            **kwargs, PaginationConfig={"PageSize": LIST_JOBS_PAGE_SIZE}
+        ):
+            summaries.extend(page.get("jobSummaryList", []))
+        return summaries
+
     def terminate_job(self, **kwargs):
         """Terminate a job in AWS Batch."""
         return self.client.terminate_job(**kwargs)
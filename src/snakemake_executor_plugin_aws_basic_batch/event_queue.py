@@ -0,0 +1,64 @@
+import json
+import logging
+
+import boto3
+
+from snakemake_executor_plugin_aws_basic_batch.batch_client import CLIENT_CONFIG
+
+# Maximum number of messages returned by a single ReceiveMessage request
+RECEIVE_MAX_MESSAGES = 10
+
+
+class JobEventQueue:
+    """Minimal wrapper around an SQS queue of AWS Batch job state change events.
+
+    The queue is expected to be the target of an EventBridge rule matching
+    "Batch Job State Change" events for the workflow's job queue.
+    """
+
+    def __init__(self, queue_url, region_name=None, logger=None):
+        self.queue_url = queue_url
+        self.logger = logger or logging.getLogger(__name__)
+        self.client = boto3.client("sqs", region_name=region_name, config=CLIENT_CONFIG)
+
+    def receive_job_events(self, max_batches=1, wait_time_seconds=1):
+        """Receive and delete pending job state change events.
+
+        Returns the ``detail`` payload of each event, which mirrors the job
+        entries returned by DescribeJobs. Only the first request long-polls;
+        draining stops early once the queue comes back empty.
+        """
+        details = []
+        for batch in range(max_batches):
+            response = self.client.receive_message(
+                QueueUrl=self.queue_url,
+                MaxNumberOfMessages=RECEIVE_MAX_MESSAGES,
+                WaitTimeSeconds=wait_time_seconds if batch == 0 else 0,
+            )
+            messages = response.get("Messages", [])
+            if not messages:
+                break
+
+            for message in messages:
+                try:
+                    detail = json.loads(message["Body"]).get("detail")
+                except (ValueError, AttributeError):
+                    detail = None
+                if isinstance(detail, dict):
+                    details.append(detail)
+
+            response = self.client.delete_message_batch(
+                QueueUrl=self.queue_url,
+                Entries=[
+                    {"Id": str(i), "ReceiptHandle": message["ReceiptHandle"]}
+                    for i, message in enumerate(messages)
+                ],
+            )
+            # Undeleted messages are received again after their visibility
+            # timeout; duplicate terminal events are harmless.
+            for failure in response.get("Failed", []):
+                self.logger.warning(
+                    f"Failed to delete job event message {failure.get('Id')}: "
+                    f"{failure.get('Code')} {failure.get('Message', '')}".rstrip()
+                )
+        return details
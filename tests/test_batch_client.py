@@ -0,0 +1,96 @@
+from types import SimpleNamespace
+
+import pytest
+
+from snakemake_executor_plugin_aws_basic_batch import batch_client
+from snakemake_executor_plugin_aws_basic_batch.batch_client import _TokenBucket
+
+
+class FakeClock:
+    """Stands in for time.monotonic/time.sleep; sleeping advances the clock."""
+
+    def __init__(self):
+        self.now = 1000.0
+        self.sleeps = []
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(batch_client.time, "monotonic", clock.monotonic)
+    monkeypatch.setattr(batch_client.time, "sleep", clock.sleep)
+    return clock
+
+
+def test_token_bucket_allows_burst_without_waiting(clock):
+    bucket = _TokenBucket(rate=10, capacity=5)
+    for _ in range(5):
+        bucket.acquire()
+    assert clock.sleeps == []
+
+
+def test_token_bucket_waits_for_refill_when_empty(clock):
+    bucket = _TokenBucket(rate=10, capacity=5)
+    for _ in range(5):
+        bucket.acquire()
+
+    bucket.acquire()
+
+    assert clock.sleeps == [pytest.approx(0.1)]
+
+
+def test_token_bucket_refills_over_time_up_to_capacity(clock):
+    bucket = _TokenBucket(rate=10, capacity=5)
+    for _ in range(5):
+        bucket.acquire()
+
+    # Far longer than needed to refill, but tokens are capped at capacity
+    clock.now += 60
+    for _ in range(5):
+        bucket.acquire()
+    assert clock.sleeps == []
+
+    bucket.acquire()
+    assert clock.sleeps == [pytest.approx(0.1)]
+
+
+def test_token_bucket_sustains_configured_rate(clock):
+    bucket = _TokenBucket(rate=45, capacity=50)
+    start = clock.now
+    for _ in range(140):
+        bucket.acquire()
+    # The burst is free, the remaining 90 tokens arrive at 45 per second
+    assert clock.now - start == pytest.approx(2.0)
+
+
+class FakePaginator:
+    def __init__(self, pages):
+        self.pages = pages
+        self.kwargs = None
+
+    def paginate(self, **kwargs):
+        self.kwargs = kwargs
+        return iter(self.pages)
+
+
+def test_list_job_summaries_requests_full_pages():
+    client = batch_client.BatchClient.__new__(batch_client.BatchClient)
+    paginator = FakePaginator(
+        [{"jobSummaryList": [{"jobId": "a"}]}, {"jobSummaryList": [{"jobId": "b"}]}]
+    )
+    client.client = SimpleNamespace(get_paginator=lambda name: paginator)
+
+    summaries = client.list_job_summaries(jobQueue="queue")
+
+    assert [summary["jobId"] for summary in summaries] == ["a", "b"]
+    assert paginator.kwargs == {
+        "jobQueue": "queue",
+        "PaginationConfig": {"PageSize": batch_client.LIST_JOBS_PAGE_SIZE},
+    }
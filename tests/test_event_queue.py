@@ -0,0 +1,83 @@
+import json
+import logging
+
+from snakemake_executor_plugin_aws_basic_batch.event_queue import JobEventQueue
+
+
+class FakeSQS:
+    """Serves canned ReceiveMessage batches and records deletions."""
+
+    def __init__(self, batches, failed=None):
+        self.batches = list(batches)
+        self.failed = failed or []
+        self.receive_calls = []
+        self.deleted = []
+
+    def receive_message(self, **kwargs):
+        self.receive_calls.append(kwargs)
+        messages = self.batches.pop(0) if self.batches else []
+        return {"Messages": messages}
+
+    def delete_message_batch(self, QueueUrl, Entries):
+        self.deleted.extend(entry["ReceiptHandle"] for entry in Entries)
+        return {"Successful": [], "Failed": self.failed}
+
+
+def message(body, handle):
+    if not isinstance(body, str):
+        body = json.dumps(body)
+    return {"Body": body, "ReceiptHandle": handle}
+
+
+def make_queue(client):
+    queue = object.__new__(JobEventQueue)
+    queue.queue_url = "https://sqs.example/queue"
+    queue.logger = logging.getLogger("test")
+    queue.client = client
+    return queue
+
+
+def test_receive_job_events_returns_details_and_skips_malformed_bodies():
+    detail = {"jobId": "a", "status": "SUCCEEDED"}
+    client = FakeSQS(
+        [
+            [
+                message({"detail": detail}, "h1"),
+                message("not json", "h2"),
+                message([1, 2], "h3"),
+                message({"detail": "oops"}, "h4"),
+                message({"source": "aws.batch"}, "h5"),
+            ]
+        ]
+    )
+
+    assert make_queue(client).receive_job_events() == [detail]
+    # Unusable messages are deleted too, so they are not redelivered forever
+    assert client.deleted == ["h1", "h2", "h3", "h4", "h5"]
+
+
+def test_receive_job_events_long_polls_first_batch_and_stops_when_empty():
+    client = FakeSQS(
+        [
+            [message({"detail": {"jobId": "a"}}, "h1")],
+            [message({"detail": {"jobId": "b"}}, "h2")],
+        ]
+    )
+
+    details = make_queue(client).receive_job_events(max_batches=5, wait_time_seconds=3)
+
+    assert [detail["jobId"] for detail in details] == ["a", "b"]
+    assert [call["WaitTimeSeconds"] for call in client.receive_calls] == [3, 0, 0]
+
+
+def test_receive_job_events_logs_failed_deletions(caplog):
+    client = FakeSQS(
+        [[message({"detail": {"jobId": "a"}}, "h1")]],
+        failed=[{"Id": "0", "Code": "ReceiptHandleIsInvalid", "SenderFault": True}],
+    )
+
+    with caplog.at_level(logging.WARNING, logger="test"):
+        make_queue(client).receive_job_events()
+
+    assert "Failed to delete job event message 0" in caplog.text
+    assert "ReceiptHandleIsInvalid" in caplog.text
@@ -0,0 +1,347 @@
+import asyncio
+import contextlib
+import json
+import logging
+import os
+import subprocess
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+
+import pytest
+from botocore.exceptions import ClientError
+from snakemake_interface_executor_plugins.executors.base import SubmittedJobInfo
+
+from snakemake_executor_plugin_aws_basic_batch import (
+    DESCRIBE_JOBS_MAX_IDS,
+    ARRAY_JOB_MAX_OVERRIDES_BYTES,
+    EVENTS_FALLBACK_SECONDS,
+    Executor,
+)
+
+
+class FakeBatchClient:
+    """Answers status polls from a fixed table of job statuses."""
+
+    def __init__(self, statuses=None):
+        self.statuses = statuses or {}
+        self.listed = 0
+        self.described = []
+        self.submitted = []
+
+    def submit_job(self, **kwargs):
+        self.submitted.append(kwargs)
+        return {"jobId": f"id-{len(self.submitted)}"}
+
+    def list_job_summaries(self, **kwargs):
+        self.listed += 1
+        return [
+            {"jobId": job_id, "status": status}
+            for job_id, status in self.statuses.items()
+        ]
+
+    def describe_jobs_bulk(self, job_ids):
+        self.described.append(list(job_ids))
+        return [
+            {"jobId": job_id, "status": self.statuses[job_id]}
+            for job_id in job_ids
+            if job_id in self.statuses
+        ]
+
+
+class FakeEventQueue:
+    def __init__(self, details):
+        self.details = details
+
+    def receive_job_events(self, max_batches=1, wait_time_seconds=1):
+        details, self.details = self.details, []
+        return details
+
+
+@pytest.fixture
+def executor():
+    """An executor wired with fakes, bypassing the workflow-driven setup."""
+    executor = object.__new__(Executor)
+    executor.logger = logging.getLogger("test")
+    executor.settings = SimpleNamespace(
+        job_queue="queue", max_concurrent_jobs=None, array_job_min_size=None
+    )
+    executor._submit_template = {"jobQueue": "queue", "jobDefinition": "definition"}
+    executor._env_overrides = [{"name": "SNAKEMAKE_VAR", "value": "1"}]
+    executor.status_rate_limiter = contextlib.nullcontext()
+    executor.batch_client = FakeBatchClient()
+    executor.event_queue = None
+    executor._last_status_poll = time.monotonic()
+    executor._base_poll_interval = 5.0
+    executor._poll_interval = 5.0
+    executor.next_seconds_between_status_checks = 5.0
+    executor._last_logged_active = -1
+    executor._pending_submissions = deque()
+    executor._num_active = 0
+    executor._cancelled = False
+    executor._submission_lock = threading.Lock()
+    executor._submit_pool = ThreadPoolExecutor(max_workers=4)
+    executor.submissions = []
+    executor.succeeded = []
+    executor.failed = []
+    executor.report_job_submission = executor.submissions.append
+    executor.report_job_success = executor.succeeded.append
+    executor.report_job_error = lambda job, msg=None, **kwargs: executor.failed.append(
+        job
+    )
+    yield executor
+    executor._submit_pool.shutdown()
+
+
+def active_job(job_id):
+    return SubmittedJobInfo(
+        job=SimpleNamespace(name=job_id),
+        external_jobid=job_id,
+        aux={"job_name": f"snakejob-{job_id}", "submitted_at": time.time()},
+    )
+
+
+def check(executor, active_jobs):
+    async def collect():
+        return [job async for job in executor.check_active_jobs(active_jobs)]
+
+    return asyncio.run(collect())
+
+
+def ids(jobs):
+    return [job.external_jobid for job in jobs]
+
+
+def test_events_resolve_only_known_jobs_with_terminal_statuses(executor):
+    executor.event_queue = FakeEventQueue(
+        [
+            {"jobId": "a", "status": "SUCCEEDED"},
+            {"jobId": "b", "status": "RUNNING"},
+            {"jobId": "c", "status": "FAILED", "statusReason": "boom"},
+            {"jobId": "unknown", "status": "SUCCEEDED"},
+        ]
+    )
+    jobs = [active_job(job_id) for job_id in ("a", "b", "c")]
+    executor._num_active = 3
+
+    still_active = check(executor, jobs)
+
+    assert ids(executor.succeeded) == ["a"]
+    assert ids(executor.failed) == ["c"]
+    assert ids(still_active) == ["b"]
+    assert executor._num_active == 1
+    # Within the fallback window nothing is polled
+    assert executor.batch_client.listed == 0
+
+
+def test_fallback_poll_excludes_jobs_resolved_by_events(executor):
+    executor.event_queue = FakeEventQueue([{"jobId": "a", "status": "SUCCEEDED"}])
+    executor.batch_client = FakeBatchClient({"b": "RUNNING"})
+    executor._last_status_poll = time.monotonic() - EVENTS_FALLBACK_SECONDS
+    jobs = [active_job("a"), active_job("b"), active_job("b:0")]
+    executor._num_active = 3
+
+    polled = []
+    poll = executor._poll_job_statuses
+    executor._poll_job_statuses = lambda jobs: polled.extend(ids(jobs)) or poll(jobs)
+
+    still_active = check(executor, jobs)
+
+    assert polled == ["b", "b:0"]
+    assert ids(executor.succeeded) == ["a"]
+    assert sorted(ids(still_active)) == ["b", "b:0"]
+
+
+def test_without_events_every_tick_polls(executor):
+    executor.batch_client = FakeBatchClient({"a": "SUCCEEDED"})
+    executor._num_active = 1
+
+    assert check(executor, [active_job("a")]) == []
+    assert executor.batch_client.described == [["a"]]
+    assert ids(executor.succeeded) == ["a"]
+
+
+def test_poll_lists_jobs_only_beyond_one_describe_request(executor):
+    jobs = [active_job(f"job{i}") for i in range(DESCRIBE_JOBS_MAX_IDS)]
+    executor.batch_client = FakeBatchClient({"job0": "RUNNING"})
+
+    executor._poll_job_statuses(jobs)
+    assert executor.batch_client.listed == 0
+
+    jobs.append(active_job("missing"))
+    jobs.append(active_job("array:0"))
+    executor.batch_client = FakeBatchClient(
+        {job.external_jobid: "RUNNING" for job in jobs[:-2]}
+    )
+
+    job_infos = executor._poll_job_statuses(jobs)
+
+    assert executor.batch_client.listed == 1
+    assert executor.batch_client.described == [["array:0", "missing"]]
+    assert len(job_infos) == DESCRIBE_JOBS_MAX_IDS
+
+
+def pending(commands):
+    return [(SimpleNamespace(name=f"job{i}"), cmd) for i, cmd in enumerate(commands)]
+
+
+def overrides_bytes(executor, group):
+    command = executor._build_array_command([cmd for _, cmd in group])
+    return len(json.dumps(executor._container_overrides(command)).encode())
+
+
+def test_group_submissions_keeps_jobs_separate_below_min_size(executor):
+    executor.settings.array_job_min_size = 3
+    groups = executor._group_submissions(pending(["echo a", "echo b"]))
+    assert [len(group) for group in groups] == [1, 1]
+
+
+def test_group_submissions_splits_groups_at_overrides_limit(executor):
+    executor.settings.array_job_min_size = 2
+    # Quotes and newlines grow under shell quoting and JSON escaping
+    commands = [f"echo 'job {i}'\n" + "x" * 200 for i in range(200)]
+
+    groups = executor._group_submissions(pending(commands))
+
+    assert len(groups) > 1
+    assert [cmd for group in groups for _, cmd in group] == commands
+    for group in groups:
+        assert overrides_bytes(executor, group) <= ARRAY_JOB_MAX_OVERRIDES_BYTES
+    # Groups are filled as far as the limit allows
+    first, second = groups[:2]
+    assert overrides_bytes(executor, first + second[:1]) > (
+        ARRAY_JOB_MAX_OVERRIDES_BYTES
+    )
+
+
+def test_group_submissions_submits_oversized_commands_individually(executor):
+    executor.settings.array_job_min_size = 2
+    commands = ["echo a", "x" * ARRAY_JOB_MAX_OVERRIDES_BYTES, "echo b", "echo c"]
+
+    groups = executor._group_submissions(pending(commands))
+
+    assert [[cmd for _, cmd in group] for group in groups] == [
+        ["echo a"],
+        [commands[1]],
+        ["echo b", "echo c"],
+    ]
+
+
+def run_array_command(script, index):
+    return subprocess.run(
+        ["/bin/bash", "-c", script],
+        env={**os.environ, "AWS_BATCH_JOB_ARRAY_INDEX": str(index)},
+        capture_output=True,
+        text=True,
+    )
+
+
+def test_build_array_command_runs_the_command_for_the_index():
+    script = Executor._build_array_command(
+        ["echo first", """printf '%s|' "it's" '$HOME' "a  b" """, "exit 3"]
+    )
+
+    assert run_array_command(script, 0).stdout == "first\n"
+    assert run_array_command(script, 1).stdout == "it's|$HOME|a  b|"
+    assert run_array_command(script, 2).returncode == 3
+
+
+def test_build_array_command_fails_for_unknown_index():
+    result = run_array_command(Executor._build_array_command(["echo a"]), 5)
+    assert result.returncode == 1
+    assert "Unknown array index: 5" in result.stderr
+
+
+def test_rejected_array_job_falls_back_to_single_submissions(executor):
+    class RejectingBatchClient(FakeBatchClient):
+        def submit_job(self, **kwargs):
+            if "arrayProperties" in kwargs:
+                raise ClientError(
+                    {"Error": {"Code": "ClientException", "Message": "too long"}},
+                    "SubmitJob",
+                )
+            return super().submit_job(**kwargs)
+
+    executor.batch_client = RejectingBatchClient()
+    group = pending(["echo a", "echo b"])
+
+    submitted, failed = executor._submit_group(group)
+
+    assert failed == []
+    assert [job for job, _, _ in submitted] == [job for job, _ in group]
+    commands = [
+        kwargs["containerOverrides"]["command"][-1]
+        for kwargs in executor.batch_client.submitted
+    ]
+    assert commands == ["echo a", "echo b"]
+
+
+def queue_jobs(executor, count):
+    with executor._submission_lock:
+        executor._pending_submissions.extend(
+            (SimpleNamespace(name=f"job{i}"), f"echo {i}") for i in range(count)
+        )
+        executor._submit_pending()
+
+
+def test_max_concurrent_jobs_defers_submissions_beyond_the_limit(executor):
+    executor.settings.max_concurrent_jobs = 2
+
+    queue_jobs(executor, 5)
+
+    assert [info.job.name for info in executor.submissions] == ["job0", "job1"]
+    assert executor._num_active == 2
+    assert len(executor._pending_submissions) == 3
+
+
+def test_finished_jobs_release_deferred_submissions(executor):
+    executor.settings.max_concurrent_jobs = 2
+    queue_jobs(executor, 5)
+    executor.batch_client.statuses = {"id-1": "SUCCEEDED", "id-2": "RUNNING"}
+
+    still_active = check(executor, list(executor.submissions))
+
+    assert ids(executor.succeeded) == ["id-1"]
+    assert ids(still_active) == ["id-2"]
+    assert [info.job.name for info in executor.submissions] == [
+        "job0",
+        "job1",
+        "job2",
+    ]
+    assert executor._num_active == 2
+    assert len(executor._pending_submissions) == 2
+
+
+def test_deferred_submission_failures_are_reported_not_raised(executor):
+    class FailingBatchClient(FakeBatchClient):
+        def submit_job(self, **kwargs):
+            if len(self.submitted) >= 1:
+                raise RuntimeError("limit exceeded")
+            return super().submit_job(**kwargs)
+
+    executor.batch_client = FailingBatchClient({"id-1": "SUCCEEDED"})
+    executor.settings.max_concurrent_jobs = 1
+    queue_jobs(executor, 2)
+
+    assert check(executor, list(executor.submissions)) == []
+
+    assert ids(executor.succeeded) == ["id-1"]
+    assert [info.job.name for info in executor.failed] == ["job1"]
+    assert executor._num_active == 0
+    assert not executor._pending_submissions
+
+
+def test_cancel_drops_deferred_submissions(executor):
+    executor.settings.max_concurrent_jobs = 1
+    executor.batch_client.terminate_job = lambda **kwargs: None
+    queue_jobs(executor, 3)
+
+    executor.cancel_jobs(list(executor.submissions))
+    with executor._submission_lock:
+        executor._num_active = 0
+        executor._submit_pending()
+
+    assert not executor._pending_submissions
+    assert [info.job.name for info in executor.submissions] == ["job0"]